@@ -4,6 +4,9 @@ from pawpal_system import Owner, Pet, Task, Scheduler, IDGenerator
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
+# Priority badges for the schedule display (built once, not per task row)
+PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
 # Step 2: Initialize session state "memory vault"
 # This runs ONCE per session, not on every button click
 if "owner" not in st.session_state:
@@ -22,6 +25,42 @@ if "current_plan" not in st.session_state:
     # Placeholder for the most recent schedule
     st.session_state.current_plan = None
 
+if "data_version" not in st.session_state:
+    # Bumped whenever a pet or task is added/removed, so cached display rows refresh
+    st.session_state.data_version = 0
+
+if "task_rows" not in st.session_state:
+    # Per-session cache of formatted task rows: (data_version, rows)
+    st.session_state.task_rows = (None, [])
+
+# Local alias for the session's Owner (avoids repeated session_state lookups)
+owner = st.session_state.owner
+
+
+def _md_cell(text: str) -> str:
+    """Escape pipe characters so user text can't break a markdown table row."""
+    return text.replace("|", "\\|")
+
+
+def _task_rows(owner: Owner) -> list:
+    """
+    Pre-format the task list rows as (task_id, pet_id, task_name, label),
+    reusing this session's rows until data_version changes.
+    """
+    version, rows = st.session_state.task_rows
+    if version == st.session_state.data_version:
+        return rows
+
+    pet_name_by_id = {pet.id: pet.name for pet in owner.pets}
+    rows = []
+    for task in owner.get_all_tasks():
+        pet_name = pet_name_by_id.get(task.pet_id, "Unknown")
+        label = f"- [{task.priority.upper()}] {task.name} ({pet_name}) - {task.duration_minutes} min"
+        rows.append((task.id, task.pet_id, task.name, label))
+    st.session_state.task_rows = (st.session_state.data_version, rows)
+    return rows
+
+
 st.title("🐾 PawPal+")
 
 st.markdown(
@@ -63,20 +102,20 @@ st.divider()
 st.subheader("Owner & Time Budget")
 col1, col2 = st.columns(2)
 with col1:
-    owner_name = st.text_input("Owner name", value=st.session_state.owner.name, key="owner_name_input")
-    st.session_state.owner.name = owner_name
+    owner_name = st.text_input("Owner name", value=owner.name, key="owner_name_input")
+    owner.name = owner_name
 with col2:
     # Use text_input for clean input without spinner buttons
     available_time = st.text_input(
         "Available time (minutes)",
-        value=str(st.session_state.owner.available_time_minutes),
+        value=str(owner.available_time_minutes),
         key="time_input"
     )
     # Convert to integer and update session state
     try:
         time_value = int(available_time)
         if 10 <= time_value <= 480:
-            st.session_state.owner.available_time_minutes = time_value
+            owner.available_time_minutes = time_value
         else:
             st.warning("Please enter a time between 10 and 480 minutes")
     except ValueError:
@@ -101,20 +140,22 @@ with st.form("add_pet_form"):
             age=age
         )
         # Add it to the owner's collection
-        st.session_state.owner.add_pet(new_pet)
+        owner.add_pet(new_pet)
+        st.session_state.data_version += 1
         st.success(f"Added {pet_name} the {species}!")
         st.rerun()
 
 # Display current pets with delete buttons
-if st.session_state.owner.pets:
-    st.write(f"**Current Pets ({len(st.session_state.owner.pets)}):**")
-    for pet in st.session_state.owner.pets:
+if owner.pets:
+    st.write(f"**Current Pets ({len(owner.pets)}):**")
+    for pet in owner.pets:
         col1, col2 = st.columns([5, 1])
         with col1:
             st.write(f"- {pet.name} ({pet.species}, {pet.age} years old) - {len(pet.tasks)} tasks")
         with col2:
             if st.button("Delete", key=f"delete_pet_{pet.id}"):
-                st.session_state.owner.remove_pet(pet.id)
+                owner.remove_pet(pet.id)
+                st.session_state.data_version += 1
                 st.success(f"Deleted {pet.name}")
                 st.rerun()
 else:
@@ -124,11 +165,11 @@ st.divider()
 
 # Add Task Section
 st.subheader("Add a Task")
-if not st.session_state.owner.pets:
+if not owner.pets:
     st.warning("Please add a pet first before adding tasks.")
 else:
     with st.form("add_task_form"):
-        pet_names = [pet.name for pet in st.session_state.owner.pets]
+        pet_names = [pet.name for pet in owner.pets]
         selected_pet_name = st.selectbox("For which pet?", pet_names)
 
         col1, col2, col3 = st.columns(3)
@@ -144,13 +185,9 @@ else:
 
         if task_submitted and task_title:
             # Find the selected pet
-            selected_pet = None
-            for pet in st.session_state.owner.pets:
-                if pet.name == selected_pet_name:
-                    selected_pet = pet
-                    break
+            selected_pet = owner.get_pet_by_name(selected_pet_name)
 
-            if selected_pet:
+            if selected_pet is not None:
                 # Create new Task
                 new_task = Task(
                     id=IDGenerator.next_id("task"),
@@ -162,25 +199,29 @@ else:
                 )
                 # Add task to pet
                 selected_pet.add_task(new_task)
+                st.session_state.data_version += 1
                 st.success(f"Added '{task_title}' for {selected_pet.name}!")
                 st.rerun()
 
+# Pet names for the display loops below, built once per rerun
+pet_name_by_id = {pet.id: pet.name for pet in owner.pets}
+
 # Display all tasks with delete buttons
-all_tasks = st.session_state.owner.get_all_tasks()
+all_tasks = owner.get_all_tasks()
 if all_tasks:
-    st.write(f"**All Tasks ({len(all_tasks)} total, {st.session_state.owner.get_total_task_time()} min):**")
-    for task in all_tasks:
-        pet = st.session_state.owner.get_pet_by_id(task.pet_id)
-        pet_name = pet.name if pet else "Unknown"
-
+    st.write(f"**All Tasks ({len(all_tasks)} total, {owner.get_total_task_time()} min):**")
+    task_rows = _task_rows(owner)
+    for task_id, pet_id, task_name, label in task_rows:
         col1, col2 = st.columns([5, 1])
         with col1:
-            st.write(f"- [{task.priority.upper()}] {task.name} ({pet_name}) - {task.duration_minutes} min")
+            st.write(label)
         with col2:
-            if st.button("Delete", key=f"delete_task_{task.id}"):
+            if st.button("Delete", key=f"delete_task_{task_id}"):
+                pet = owner.get_pet_by_id(pet_id)
                 if pet:
-                    pet.remove_task(task.id)
-                    st.success(f"Deleted '{task.name}'")
+                    pet.remove_task(task_id)
+                    st.session_state.data_version += 1
+                    st.success(f"Deleted '{task_name}'")
                     st.rerun()
 else:
     st.info("No tasks yet. Add one above.")
@@ -191,13 +232,13 @@ st.subheader("Generate Schedule")
 st.caption("Click below to generate today's optimized schedule based on priority and time constraints.")
 
 if st.button("Generate Schedule", type="primary"):
-    if not st.session_state.owner.pets:
+    if not owner.pets:
         st.error("Please add at least one pet first.")
     elif not all_tasks:
         st.error("Please add at least one task first.")
     else:
         # Call the scheduler!
-        plan = st.session_state.scheduler.generate_plan(st.session_state.owner)
+        plan = st.session_state.scheduler.generate_plan(owner)
         st.session_state.current_plan = plan
         st.success("Schedule generated!")
         st.rerun()
@@ -221,29 +262,22 @@ if st.session_state.current_plan:
     # Show explanation
     st.info(plan.explanation)
 
-    # Show scheduled tasks
+    # Show scheduled tasks as one markdown table (a single element, not a row of columns per task)
     if plan.scheduled_tasks:
         st.markdown("### ✅ Scheduled Tasks")
+        table_lines = ["| # | Task | Priority | Duration |", "|---|---|---|---|"]
         for i, task in enumerate(plan.scheduled_tasks, 1):
-            pet = st.session_state.owner.get_pet_by_id(task.pet_id)
-            pet_name = pet.name if pet else "Unknown"
-
-            with st.container():
-                col1, col2, col3, col4 = st.columns([1, 3, 2, 1])
-                with col1:
-                    st.write(f"**{i}.**")
-                with col2:
-                    st.write(f"**{task.name}** ({pet_name})")
-                with col3:
-                    priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}
-                    st.write(f"{priority_emoji.get(task.priority, '')} {task.priority.capitalize()}")
-                with col4:
-                    st.write(f"{task.duration_minutes} min")
+            pet_name = pet_name_by_id.get(task.pet_id, "Unknown")
+            task_cell = _md_cell(f"**{task.name}** ({pet_name})")
+            priority_cell = f"{PRIORITY_EMOJI.get(task.priority, '')} {task.priority.capitalize()}"
+            table_lines.append(f"| {i} | {task_cell} | {priority_cell} | {task.duration_minutes} min |")
+        st.markdown("\n".join(table_lines))
 
     # Show skipped tasks
     if plan.skipped_tasks:
         st.markdown("### ⏭️ Skipped Tasks (not enough time)")
+        skipped_lines = []
         for task in plan.skipped_tasks:
-            pet = st.session_state.owner.get_pet_by_id(task.pet_id)
-            pet_name = pet.name if pet else "Unknown"
-            st.write(f"- {task.name} ({pet_name}) - {task.duration_minutes} min [{task.priority}]")
+            pet_name = pet_name_by_id.get(task.pet_id, "Unknown")
+            skipped_lines.append(f"- {task.name} ({pet_name}) - {task.duration_minutes} min [{task.priority}]")
+        st.markdown("\n".join(skipped_lines))
@@ -3,16 +3,91 @@ PawPal+ System - Pet Care Planning Logic
 This module contains the core classes for managing pets, tasks, and scheduling.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Tuple
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from bisect import bisect_right
+from itertools import accumulate, chain, count
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Tuple
 from datetime import datetime, timedelta
+from enum import IntEnum
+from functools import partial
+
+
+# =============================================================================
+# HELPER CONSTANTS
+# =============================================================================
+
+class Priority(IntEnum):
+    """Numeric task priority; higher values are scheduled first."""
+    HIGH = 3
+    MEDIUM = 2
+    LOW = 1
+
+
+# Task priority mapping
+PRIORITY_VALUES = {
+    "high": Priority.HIGH,
+    "medium": Priority.MEDIUM,
+    "low": Priority.LOW
+}
+
+# Priority levels, highest first (bucket order for scheduling)
+PRIORITY_LEVELS = sorted(Priority, reverse=True)
+
+# Valid task categories
+TASK_CATEGORIES = [
+    "Walk",
+    "Feeding",
+    "Medication",
+    "Grooming",
+    "Enrichment",
+    "Training"
+]
+
+
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+def _delete_identical(items: list, item: object) -> None:
+    """
+    Delete one specific object from a list in place.
+    Matches by identity, since dataclass == compares field values.
+    """
+    for index, candidate in enumerate(items):
+        if candidate is item:
+            del items[index]
+            return
+
+
+def _shallow_copy(obj: object, state: dict) -> object:
+    """
+    Build a shallow copy of a slotted dataclass from its saved state.
+    Unlike __setstate__, shared children are not re-linked to the copy.
+    """
+    clone = object.__new__(type(obj))
+    for name, value in state.items():
+        object.__setattr__(clone, name, value)
+    return clone
+
+
+def _slot_property(cls: type, name: str, setter) -> property:
+    """
+    Wrap the slot `name` of a slotted dataclass in a property.
+    Reads go straight to the slot; writes call setter(obj, value, store),
+    where store(obj, value) writes the underlying slot.
+    """
+    slot = cls.__dict__[name]
+    return property(slot.__get__, partial(setter, store=slot.__set__))
 
 
 # =============================================================================
 # DATA CLASSES (Data-holding objects)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Owner:
     """
     Represents a pet owner.
@@ -22,99 +97,347 @@ class Owner:
     name: str
     available_time_minutes: int
     pets: List['Pet'] = field(default_factory=list)
+    # Memoized aggregates, rebuilt lazily after any pet/task change
+    _tasks_cache: 'List[Task] | None' = field(default=None, init=False, repr=False, compare=False)
+    _total_time_cache: 'int | None' = field(default=None, init=False, repr=False, compare=False)
+    _priority_tasks_cache: 'List[Task] | None' = field(default=None, init=False, repr=False, compare=False)
+    # Index for O(1) lookups by pet ID, kept in sync by add_pet/remove_pet
+    _pets_by_id: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Name -> first pet added with that name
+    _pets_by_name: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index and link any pets passed to the constructor back to this owner."""
+        for pet in self.pets:
+            self._check_new_pet_id(pet)
+            self._check_pet_unowned(pet)
+            pet._owner = weakref.ref(self)
+            self._pets_by_id[pet.id] = pet
+            self._pets_by_name.setdefault(pet.name, pet)
+
+    def __getstate__(self) -> dict:
+        """Pickle/copy support for the slotted dataclass."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore fields, then re-link the (copied) pets back to this owner."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        for pet in self.pets:
+            pet._owner = weakref.ref(self)
+
+    def __copy__(self) -> 'Owner':
+        """Shallow copy; the shared pets stay linked to this owner."""
+        return _shallow_copy(self, self.__getstate__())
+
+    def _invalidate(self) -> None:
+        """Drop cached aggregates so the next read rebuilds them."""
+        self._tasks_cache = None
+        self._total_time_cache = None
+        self._priority_tasks_cache = None
+
+    def _check_new_pet_id(self, pet: 'Pet') -> None:
+        """Raise ValueError if another pet already uses this pet's ID."""
+        if pet.id in self._pets_by_id:
+            raise ValueError(f"Pet id ({pet.id}) is already used by another pet")
+
+    def _check_pet_unowned(self, pet: 'Pet') -> None:
+        """Raise ValueError if the pet still belongs to a different owner."""
+        owner = pet._owner() if pet._owner is not None else None
+        if owner is not None and owner is not self:
+            raise ValueError(f"Pet '{pet.name}' already belongs to owner '{owner.name}'")
 
     def add_pet(self, pet: 'Pet') -> None:
-        """Add a pet to the owner's collection."""
+        """
+        Add a pet to the owner's collection.
+        Validates that no other pet already has the same ID
+        and that the pet doesn't belong to another owner.
+        """
+        self._check_new_pet_id(pet)
+        self._check_pet_unowned(pet)
+        pet._owner = weakref.ref(self)
+        self._pets_by_id[pet.id] = pet
+        self._pets_by_name.setdefault(pet.name, pet)
         self.pets.append(pet)
+        self._invalidate()
 
     def remove_pet(self, pet_id: int) -> None:
         """Remove a pet by its ID."""
-        self.pets = [pet for pet in self.pets if pet.id != pet_id]
+        pet = self._pets_by_id.pop(pet_id, None)
+        if pet is None:
+            return
+
+        _delete_identical(self.pets, pet)
+        pet._owner = None
+        self._reindex_pet_name(pet.name)
+        self._invalidate()
+
+    def _reindex_pet_name(self, name: str) -> None:
+        """Point a name at the next remaining pet with that name, if any."""
+        self._pets_by_name.pop(name, None)
+        for pet in self.pets:
+            if pet.name == name:
+                self._pets_by_name[name] = pet
+                break
+
+    def _pet_renamed(self, old_name: str, new_name: str) -> None:
+        """Re-index both names after one of this owner's pets is renamed."""
+        self._reindex_pet_name(old_name)
+        self._reindex_pet_name(new_name)
 
     def get_pet_by_id(self, pet_id: int) -> 'Pet | None':
         """
         Find a pet by its ID.
         Returns None if no pet with that ID exists.
         """
-        for pet in self.pets:
-            if pet.id == pet_id:
-                return pet
-        return None
+        return self._pets_by_id.get(pet_id)
+
+    def get_pet_by_name(self, name: str) -> 'Pet | None':
+        """
+        Find a pet by its name.
+        If several pets share a name, the first one added is returned.
+        Returns None if no pet with that name exists.
+        """
+        return self._pets_by_name.get(name)
+
+    def iter_all_tasks(self) -> Iterator['Task']:
+        """Iterate over every task of every pet without building a list."""
+        return chain.from_iterable(pet.tasks for pet in self.pets)
 
     def get_all_tasks(self) -> List['Task']:
-        """Collect all tasks from all pets owned by this owner."""
-        all_tasks = []
-        for pet in self.pets:
-            all_tasks.extend(pet.tasks)
-        return all_tasks
+        """
+        Collect all tasks from all pets owned by this owner.
+        The list is cached until a pet or task is added/removed,
+        so callers should treat it as read-only.
+        """
+        if self._tasks_cache is None:
+            self._tasks_cache = list(self.iter_all_tasks())
+        return self._tasks_cache
+
+    def get_tasks_by_priority(self) -> List['Task']:
+        """
+        Collect all tasks ordered by priority (high to low).
+        Same order as a stable priority sort of get_all_tasks(), but built
+        from each pet's priority buckets; cached like get_all_tasks.
+        """
+        if self._priority_tasks_cache is None:
+            self._priority_tasks_cache = [
+                task
+                for level in PRIORITY_LEVELS
+                for pet in self.pets
+                for task in pet.get_tasks_with_priority(level)
+            ]
+        return self._priority_tasks_cache
 
     def get_total_task_time(self) -> int:
         """Calculate the total duration of all tasks across all pets."""
-        return sum(task.duration_minutes for task in self.get_all_tasks())
+        if self._total_time_cache is None:
+            self._total_time_cache = sum(pet.get_total_task_time() for pet in self.pets)
+        return self._total_time_cache
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Pet:
     """
     Represents a pet.
     Holds pet profile information and manages associated care tasks.
     """
+    # Weak back-reference set by Owner.add_pet (avoids a reference cycle).
+    # Declared first so it is already None when __init__ assigns name.
+    _owner: 'weakref.ref[Owner] | None' = field(default=None, init=False, repr=False, compare=False)
     id: int
     name: str
     species: str
     age: int
     tasks: List['Task'] = field(default_factory=list)
+    # Index for O(1) lookups by task ID, kept in sync by add_task/remove_task
+    _tasks_by_id: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Running sum of task durations, updated by add_task/remove_task
+    _total_time: int = field(default=0, init=False, repr=False, compare=False)
+    # Tasks grouped by priority level (insertion order kept within a level)
+    _tasks_by_priority: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index any tasks passed to the constructor."""
+        for task in self.tasks:
+            self._check_new_task_id(task)
+            self._tasks_by_id[task.id] = task
+            task._pet = weakref.ref(self)
+        self._total_time = sum(task.duration_minutes for task in self.tasks)
+        self._tasks_by_priority = {level: [] for level in PRIORITY_LEVELS}
+        for task in self.tasks:
+            self._tasks_by_priority[task._priority_value].append(task)
+
+    def __getstate__(self) -> dict:
+        """Pickle/copy support; the weak owner link is dropped and restored by Owner."""
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["_owner"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore fields saved by __getstate__, then re-link tasks to this pet."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        for task in self.tasks:
+            task._pet = weakref.ref(self)
+
+    def __copy__(self) -> 'Pet':
+        """Shallow copy; the shared tasks stay linked to this pet."""
+        return _shallow_copy(self, self.__getstate__())
+
+    def _set_name(self, value: str, store) -> None:
+        """Setter for name; keeps the owner's name index in sync on renames."""
+        owner = self._owner() if self._owner is not None else None
+        if owner is None:
+            store(self, value)
+            return
+        old_name = self.name
+        store(self, value)
+        owner._pet_renamed(old_name, value)
+
+    def _invalidate_owner(self) -> None:
+        """Tell the owning Owner (if any) that its cached aggregates are stale."""
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner._invalidate()
+
+    def _check_new_task_id(self, task: 'Task') -> None:
+        """Raise ValueError if another task of this pet already uses the task's ID."""
+        if task.id in self._tasks_by_id:
+            raise ValueError(f"Task id ({task.id}) is already used by another task")
 
     def add_task(self, task: 'Task') -> None:
         """
         Add a care task for this pet.
-        Validates that task.pet_id matches this pet's ID.
+        Validates that task.pet_id matches this pet's ID
+        and that no other task already has the same ID.
         """
         if task.pet_id != self.id:
             raise ValueError(
                 f"Task pet_id ({task.pet_id}) doesn't match Pet id ({self.id})"
             )
+        self._check_new_task_id(task)
+        task._pet = weakref.ref(self)
+        self._tasks_by_id[task.id] = task
         self.tasks.append(task)
+        self._tasks_by_priority[task._priority_value].append(task)
+        self._total_time += task.duration_minutes
+        self._invalidate_owner()
 
     def remove_task(self, task_id: int) -> None:
         """Remove a task by its ID."""
-        self.tasks = [task for task in self.tasks if task.id != task_id]
+        removed = self._tasks_by_id.pop(task_id, None)
+        if removed is None:
+            return
+        removed._pet = None
+        self._total_time -= removed.duration_minutes
+        _delete_identical(self.tasks, removed)
+        _delete_identical(self._tasks_by_priority[removed._priority_value], removed)
+        self._invalidate_owner()
+
+    def _task_duration_changed(self, old_duration: int, new_duration: int) -> None:
+        """Keep the running total in sync when one of this pet's tasks is edited."""
+        self._total_time += new_duration - old_duration
+        self._invalidate_owner()
+
+    def _task_priority_changed(self, task: 'Task', old_level: Priority) -> None:
+        """Move an edited task to its new priority bucket, keeping the order tasks were added."""
+        for level in (old_level, task._priority_value):
+            self._tasks_by_priority[level] = [
+                t for t in self.tasks if t._priority_value == level
+            ]
+        self._invalidate_owner()
 
     def get_task_by_id(self, task_id: int) -> 'Task | None':
         """
         Find a task by its ID.
         Returns None if no task with that ID exists.
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks_by_id.get(task_id)
 
     def get_tasks(self) -> List['Task']:
         """Return all tasks for this pet."""
         return self.tasks
 
+    def get_tasks_with_priority(self, level: Priority) -> List['Task']:
+        """Return this pet's tasks at one priority level, in the order they were added."""
+        return self._tasks_by_priority[level]
+
     def get_total_task_time(self) -> int:
         """Calculate the total duration of all tasks for this pet."""
-        return sum(task.duration_minutes for task in self.tasks)
+        return self._total_time
+
+
+# Renaming a pet must update its owner's name index
+Pet.name = _slot_property(Pet, "name", Pet._set_name)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Represents a single pet care activity.
     Contains task details including duration and priority.
     """
+    # Weak back-reference set by Pet.add_task so edits can update the pet's totals.
+    # Declared first so it is already None when __init__ assigns the tracked fields.
+    _pet: 'weakref.ref[Pet] | None' = field(default=None, init=False, repr=False, compare=False)
     id: int
     name: str
     category: str
     duration_minutes: int
-    priority: str  # "high", "medium", or "low"
+    priority: str  # "high", "medium", or "low" (a Priority member or 1-3 is also accepted)
     pet_id: int
     time: str = "09:00"  # Time in HH:MM format
     recurrence: str = "once"  # Options: "once", "daily", "weekly"
     due_date: str = ""  # Date in YYYY-MM-DD format
     is_completed: bool = False
+    # Numeric priority, recomputed whenever priority is assigned (used as the sort key)
+    _priority_value: Priority = field(init=False, repr=False, compare=False)
+
+    def _set_priority(self, value, store) -> None:
+        """
+        Setter for priority.
+        Normalizes the value, precomputes its numeric level and, if a pet holds
+        this task, moves the task to its new priority bucket.
+        """
+        # Accept a Priority member or its int value as well as a string; store the
+        # lowercase name (Priority() raises ValueError for an unknown number)
+        value = Priority(value).name.lower() if isinstance(value, int) else value.lower()
+        store(self, value)
+        level = PRIORITY_VALUES.get(value, Priority.LOW)
+        pet = self._linked_pet()
+        if pet is None:
+            self._priority_value = level
+            return
+        old_level = self._priority_value
+        self._priority_value = level
+        if old_level != level:
+            pet._task_priority_changed(self, old_level)
+
+    def _set_duration_minutes(self, value: int, store) -> None:
+        """Setter for duration_minutes; keeps the holding pet's running total in sync."""
+        pet = self._linked_pet()
+        if pet is None:
+            store(self, value)
+            return
+        old_duration = self.duration_minutes
+        store(self, value)
+        pet._task_duration_changed(old_duration, value)
+
+    def _linked_pet(self) -> 'Pet | None':
+        """Return the pet currently holding this task, if any."""
+        return self._pet() if self._pet is not None else None
+
+    def __getstate__(self) -> dict:
+        """Pickle/copy support; the weak pet link is dropped and restored by Pet."""
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["_pet"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore fields saved by __getstate__."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def get_priority_value(self) -> int:
         """
@@ -122,7 +445,7 @@ class Task:
         Returns: 3 for high, 2 for medium, 1 for low
         Defaults to 1 (low) if priority is invalid.
         """
-        return PRIORITY_VALUES.get(self.priority.lower(), 1)
+        return self._priority_value
 
     def mark_complete(self) -> None:
         """
@@ -167,7 +490,13 @@ class Task:
         self.is_completed = False  # Reset to incomplete
 
 
-@dataclass
+# Only priority and duration_minutes need bookkeeping when assigned, so just those
+# two slots go through setters; every other field keeps plain slot access.
+Task.priority = _slot_property(Task, "priority", Task._set_priority)
+Task.duration_minutes = _slot_property(Task, "duration_minutes", Task._set_duration_minutes)
+
+
+@dataclass(slots=True)
 class SchedulePlan:
     """
     Represents the result of scheduling.
@@ -178,26 +507,33 @@ class SchedulePlan:
     explanation: str = ""
     time_used: int = 0
     time_available: int = 0
+    # Counts filled in once at construction
+    scheduled_count: int = field(default=0, init=False)
+    skipped_count: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        """Record task counts so UI refreshes don't recompute them."""
+        self.scheduled_count = len(self.scheduled_tasks)
+        self.skipped_count = len(self.skipped_tasks)
 
     def get_summary(self) -> str:
         """Return a formatted summary of the schedule."""
-        summary_lines = [
-            f"Daily Schedule Summary",
-            f"Time Available: {self.time_available} minutes",
-            f"Scheduled: {self.get_scheduled_count()} tasks ({self.time_used} min)",
-            f"Skipped: {self.get_skipped_count()} tasks",
-            f"",
+        return (
+            f"Daily Schedule Summary\n"
+            f"Time Available: {self.time_available} minutes\n"
+            f"Scheduled: {self.scheduled_count} tasks ({self.time_used} min)\n"
+            f"Skipped: {self.skipped_count} tasks\n"
+            f"\n"
             f"{self.explanation}"
-        ]
-        return "\n".join(summary_lines)
+        )
 
     def get_scheduled_count(self) -> int:
         """Return the number of scheduled tasks."""
-        return len(self.scheduled_tasks)
+        return self.scheduled_count
 
     def get_skipped_count(self) -> int:
         """Return the number of skipped tasks."""
-        return len(self.skipped_tasks)
+        return self.skipped_count
 
 
 # =============================================================================
@@ -221,20 +557,21 @@ class Scheduler:
         Returns:
             SchedulePlan object containing scheduled/skipped tasks and explanation
         """
-        # Step 1: Collect all tasks from all pets
-        all_tasks = owner.get_all_tasks()
-
-        # Step 2: Sort tasks by priority (high to low)
-        sorted_tasks = self._sort_tasks_by_priority(all_tasks)
-
-        # Step 3: Fit tasks into available time
-        scheduled, skipped = self._fit_tasks_to_time(
-            sorted_tasks,
-            owner.available_time_minutes
-        )
-
-        # Step 4: Calculate time used
-        time_used = sum(task.duration_minutes for task in scheduled)
+        # Step 1 & 2: Collect all tasks, already ordered by priority (high to low).
+        # Pets keep their tasks bucketed by priority, so no sort is needed here.
+        sorted_tasks = owner.get_tasks_by_priority()
+
+        # Step 3 & 4: Fit tasks into available time and calculate time used.
+        # The owner's total is cached, so when everything fits we skip the fit.
+        total_time = owner.get_total_task_time()
+        if total_time <= owner.available_time_minutes:
+            scheduled, skipped = list(sorted_tasks), []
+            time_used = total_time
+        else:
+            scheduled, skipped, time_used = self._fit_tasks_to_time(
+                sorted_tasks,
+                owner.available_time_minutes
+            )
 
         # Step 5: Generate explanation
         explanation = self._generate_explanation(
@@ -250,24 +587,44 @@ class Scheduler:
             time_available=owner.available_time_minutes
         )
 
+    def generate_plans(self, owners: Iterable[Owner]) -> List[SchedulePlan]:
+        """
+        Generate daily care plans for several owners in one call.
+
+        Args:
+            owners: The pet owners to plan for
+
+        Returns:
+            One SchedulePlan per owner, in the same order
+        """
+        generate_plan = self.generate_plan
+        return [generate_plan(owner) for owner in owners]
+
     def _sort_tasks_by_priority(self, tasks: List[Task]) -> List[Task]:
         """
         Sort tasks by priority (high to low).
         Private helper method.
 
+        There are only a few priority levels, so this is a single bucket
+        pass rather than a comparison sort. Tasks keep their original
+        order within a priority level (same result as a stable sort).
+
         Args:
             tasks: List of tasks to sort
 
         Returns:
             Sorted list of tasks (high priority first)
         """
-        return sorted(tasks, key=lambda task: task.get_priority_value(), reverse=True)
+        buckets = {value: [] for value in PRIORITY_LEVELS}
+        for task in tasks:
+            buckets[task._priority_value].append(task)
+        return list(chain.from_iterable(buckets.values()))
 
     def _fit_tasks_to_time(
         self,
         tasks: List[Task],
         available_time: int
-    ) -> Tuple[List[Task], List[Task]]:
+    ) -> Tuple[List[Task], List[Task], int]:
         """
         Fit tasks into available time budget using greedy algorithm.
         Private helper method.
@@ -277,22 +634,38 @@ class Scheduler:
             available_time: Available time in minutes
 
         Returns:
-            Tuple of (scheduled_tasks, skipped_tasks)
+            Tuple of (scheduled_tasks, skipped_tasks, time_used)
         """
+        # totals[i] is the combined duration of the first i tasks. Durations
+        # are non-negative, so totals is sorted and each run of consecutive
+        # tasks that fits is found with one C-level binary search.
+        durations = [task.duration_minutes for task in tasks]
+        totals = [0, *accumulate(durations)]
+        # shortest_after[i] is the shortest duration among tasks[i:]
+        shortest_after = list(accumulate(reversed(durations), min))[::-1]
+
         scheduled = []
         skipped = []
         time_remaining = available_time
+        start = 0
 
-        for task in tasks:
-            if task.duration_minutes <= time_remaining:
-                # Task fits! Schedule it
-                scheduled.append(task)
-                time_remaining -= task.duration_minutes
-            else:
+        while start < len(tasks):
+            if time_remaining < shortest_after[start]:
+                # None of the remaining tasks can fit; skip them all at once
+                skipped.extend(tasks[start:])
+                break
+
+            # Tasks start..end-1 fit together; tasks[end] (if any) does not
+            end = max(bisect_right(totals, totals[start] + time_remaining, lo=start) - 1, start)
+            scheduled.extend(tasks[start:end])
+            time_remaining -= totals[end] - totals[start]
+
+            if end < len(tasks):
                 # Task doesn't fit, skip it
-                skipped.append(task)
+                skipped.append(tasks[end])
+            start = end + 1
 
-        return scheduled, skipped
+        return scheduled, skipped, available_time - time_remaining
 
     def _generate_explanation(
         self,
@@ -340,7 +713,8 @@ class Scheduler:
         Returns:
             Sorted list of tasks ordered by time (HH:MM format)
         """
-        return sorted(tasks, key=lambda task: task.time)
+        # Zero-padded "HH:MM" strings sort the same lexically as chronologically
+        return sorted(tasks, key=attrgetter('time'))
 
     def filter_by_status(self, tasks: List[Task], is_completed: bool) -> List[Task]:
         """
@@ -355,53 +729,36 @@ class Scheduler:
         """
         return [task for task in tasks if task.is_completed == is_completed]
 
-    def filter_by_pet_name(self, tasks: List[Task], pet_name: str, owner: Owner) -> List[Task]:
+    def filter_by_pet_name(
+        self,
+        tasks: List[Task],
+        pet_name: 'str | Iterable[str]',
+        owner: Owner
+    ) -> List[Task]:
         """
         Filter tasks by pet name.
 
         Args:
             tasks: List of tasks to filter
-            pet_name: Name of the pet
+            pet_name: Name of the pet, or several names to match any of them
             owner: Owner object to look up pet by name
 
         Returns:
-            Filtered list of tasks for the specified pet
+            Filtered list of tasks for the specified pet(s)
         """
-        # Find the pet by name
-        target_pet = None
-        for pet in owner.pets:
-            if pet.name == pet_name:
-                target_pet = pet
-                break
+        names = [pet_name] if isinstance(pet_name, str) else pet_name
+
+        # Resolve names to pet IDs once; unknown names are ignored
+        target_ids = frozenset(
+            pet.id for pet in map(owner.get_pet_by_name, names) if pet is not None
+        )
 
-        # If pet not found, return empty list
-        if target_pet is None:
+        # If no pet found, return empty list
+        if not target_ids:
             return []
 
         # Filter tasks by pet_id
-        return [task for task in tasks if task.pet_id == target_pet.id]
-
-
-# =============================================================================
-# HELPER CONSTANTS
-# =============================================================================
-
-# Task priority mapping
-PRIORITY_VALUES = {
-    "high": 3,
-    "medium": 2,
-    "low": 1
-}
-
-# Valid task categories
-TASK_CATEGORIES = [
-    "Walk",
-    "Feeding",
-    "Medication",
-    "Grooming",
-    "Enrichment",
-    "Training"
-]
+        return [task for task in tasks if task.pet_id in target_ids]
 
 
 # =============================================================================
@@ -413,7 +770,8 @@ class IDGenerator:
     Simple ID generator for Owner, Pet, and Task objects.
     Optional helper to avoid manual ID management.
     """
-    _counters = {"owner": 0, "pet": 0, "task": 0}
+    # One itertools.count per entity type, created on first use
+    _counters = defaultdict(lambda: count(1))
 
     @classmethod
     def next_id(cls, entity_type: str) -> int:
@@ -426,10 +784,9 @@ class IDGenerator:
         Returns:
             Next available ID number
         """
-        cls._counters[entity_type] += 1
-        return cls._counters[entity_type]
+        return next(cls._counters[entity_type])
 
     @classmethod
     def reset(cls) -> None:
         """Reset all counters (useful for testing)."""
-        cls._counters = {"owner": 0, "pet": 0, "task": 0}
+        cls._counters = defaultdict(lambda: count(1))
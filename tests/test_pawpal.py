@@ -3,7 +3,12 @@ Tests for PawPal+ System
 Run with: python -m pytest
 """
 
-from pawpal_system import Pet, Task
+import copy
+import pickle
+
+import pytest
+
+from pawpal_system import Owner, Pet, Task, Priority, Scheduler, SchedulePlan, IDGenerator
 
 
 def test_task_completion():
@@ -49,3 +54,539 @@ def test_task_addition():
     # Assert
     assert initial_count == 0, "Pet should start with 0 tasks"
     assert final_count == 1, "Pet should have 1 task after adding"
+
+
+def test_pet_total_task_time_tracks_add_and_remove():
+    """Verify a pet's running total follows task additions and removals."""
+    # Arrange
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    walk = Task(id=1, name="Walk", category="Walk",
+                duration_minutes=30, priority="high", pet_id=pet.id)
+    feed = Task(id=2, name="Feed", category="Feeding",
+                duration_minutes=10, priority="low", pet_id=pet.id)
+
+    # Act / Assert
+    pet.add_task(walk)
+    pet.add_task(feed)
+    assert pet.get_total_task_time() == 40
+
+    pet.remove_task(walk.id)
+    assert pet.get_total_task_time() == 10
+
+    pet.remove_task(feed.id)
+    assert pet.get_total_task_time() == 0
+
+
+def test_owner_task_cache_invalidation():
+    """Verify cached owner totals refresh when pets or tasks change."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    assert owner.get_all_tasks() == []
+    assert owner.get_total_task_time() == 0
+
+    # Act
+    pet.add_task(Task(id=1, name="Walk", category="Walk",
+                      duration_minutes=30, priority="high", pet_id=pet.id))
+    pet.add_task(Task(id=2, name="Feed", category="Feeding",
+                      duration_minutes=10, priority="low", pet_id=pet.id))
+
+    # Assert
+    assert [task.id for task in owner.get_all_tasks()] == [1, 2]
+    assert owner.get_total_task_time() == 40
+    assert [task.id for task in owner.iter_all_tasks()] == [1, 2]
+
+    pet.remove_task(1)
+    assert [task.id for task in owner.get_all_tasks()] == [2]
+    assert owner.get_total_task_time() == 10
+
+    owner.remove_pet(pet.id)
+    assert owner.get_all_tasks() == []
+    assert owner.get_total_task_time() == 0
+
+
+def test_lookup_by_id():
+    """Verify pets and tasks can be found by ID, and not after removal."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=7, name="Luna", species="Cat", age=5)
+    task = Task(id=42, name="Brush fur", category="Grooming",
+                duration_minutes=15, priority="low", pet_id=pet.id)
+    owner.add_pet(pet)
+    pet.add_task(task)
+
+    # Assert
+    assert owner.get_pet_by_id(7) is pet
+    assert pet.get_task_by_id(42) is task
+    assert owner.get_pet_by_id(99) is None
+
+    pet.remove_task(42)
+    owner.remove_pet(7)
+    assert pet.get_task_by_id(42) is None
+    assert owner.get_pet_by_id(7) is None
+
+
+def test_greedy_fit_schedules_smaller_task_after_skip():
+    """Verify a task that doesn't fit is skipped but later ones still get a chance."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=50)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    pet.add_task(Task(id=1, name="Walk", category="Walk",
+                      duration_minutes=30, priority="high", pet_id=pet.id))
+    pet.add_task(Task(id=2, name="Grooming", category="Grooming",
+                      duration_minutes=40, priority="medium", pet_id=pet.id))
+    pet.add_task(Task(id=3, name="Feed", category="Feeding",
+                      duration_minutes=15, priority="low", pet_id=pet.id))
+
+    # Act
+    plan = Scheduler().generate_plan(owner)
+
+    # Assert
+    assert [task.id for task in plan.scheduled_tasks] == [1, 3]
+    assert [task.id for task in plan.skipped_tasks] == [2]
+    assert plan.time_used == 45
+
+
+def test_priority_value_is_normalized():
+    """Verify priority is lowercased and mapped to its numeric value."""
+    task = Task(id=1, name="Meds", category="Medication",
+                duration_minutes=5, priority="High", pet_id=1)
+    unknown = Task(id=2, name="Nap", category="Enrichment",
+                   duration_minutes=5, priority="urgent", pet_id=1)
+
+    assert task.priority == "high"
+    assert task.get_priority_value() == 3
+    assert task.get_priority_value() is Priority.HIGH
+    assert unknown.get_priority_value() is Priority.LOW
+
+
+def test_task_accepts_priority_enum():
+    """Verify a Priority member or its int value can be passed instead of a string."""
+    task = Task(id=1, name="Meds", category="Medication",
+                duration_minutes=5, priority=Priority.HIGH, pet_id=1)
+
+    assert task.priority == "high"
+    assert task.get_priority_value() is Priority.HIGH
+
+    task.priority = Priority.MEDIUM
+    assert task.priority == "medium"
+    assert task.get_priority_value() is Priority.MEDIUM
+
+    task.priority = 1
+    assert task.priority == "low"
+    assert task.get_priority_value() is Priority.LOW
+    assert Task(id=2, name="Walk", category="Walk", duration_minutes=5,
+                priority=3, pet_id=1).priority == "high"
+    with pytest.raises(ValueError):
+        task.priority = 5
+
+
+def test_filter_by_pet_name():
+    """Verify filtering by one or several pet names returns only their tasks."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    mochi = Pet(id=1, name="Mochi", species="Dog", age=3)
+    luna = Pet(id=2, name="Luna", species="Cat", age=5)
+    owner.add_pet(mochi)
+    owner.add_pet(luna)
+    mochi.add_task(Task(id=1, name="Walk", category="Walk",
+                        duration_minutes=30, priority="high", pet_id=mochi.id))
+    luna.add_task(Task(id=2, name="Feed", category="Feeding",
+                       duration_minutes=10, priority="high", pet_id=luna.id))
+    scheduler = Scheduler()
+    tasks = owner.get_all_tasks()
+
+    # Assert
+    assert [t.id for t in scheduler.filter_by_pet_name(tasks, "Luna", owner)] == [2]
+    assert [t.id for t in scheduler.filter_by_pet_name(tasks, ["Mochi", "Luna"], owner)] == [1, 2]
+    assert scheduler.filter_by_pet_name(tasks, "Rex", owner) == []
+
+    owner.remove_pet(luna.id)
+    assert owner.get_pet_by_name("Luna") is None
+
+
+def test_get_pet_by_name_with_shared_names():
+    """Verify the first pet added with a name wins, and the next takes over on removal."""
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    first = Pet(id=1, name="Buddy", species="Dog", age=3)
+    second = Pet(id=2, name="Buddy", species="Cat", age=5)
+    owner.add_pet(first)
+    owner.add_pet(second)
+
+    assert owner.get_pet_by_name("Buddy") is first
+
+    owner.remove_pet(first.id)
+    assert owner.get_pet_by_name("Buddy") is second
+
+
+def test_renaming_a_pet_updates_name_lookups():
+    """Verify lookups and name filters follow a pet's new name."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    pet.add_task(Task(id=1, name="Walk", category="Walk",
+                      duration_minutes=30, priority="high", pet_id=pet.id))
+
+    # Act
+    pet.name = "Rex"
+
+    # Assert
+    assert owner.get_pet_by_name("Rex") is pet
+    assert owner.get_pet_by_name("Mochi") is None
+    tasks = owner.get_all_tasks()
+    assert [t.id for t in Scheduler().filter_by_pet_name(tasks, "Rex", owner)] == [1]
+
+
+def test_sort_by_time():
+    """Verify tasks are ordered by their HH:MM time, earliest first."""
+    tasks = [
+        Task(id=i, name=f"Task {i}", category="Walk", duration_minutes=10,
+             priority="medium", pet_id=1, time=time)
+        for i, time in enumerate(["17:00", "07:30", "08:00", "20:00"], 1)
+    ]
+
+    sorted_tasks = Scheduler().sort_by_time(tasks)
+
+    assert [task.time for task in sorted_tasks] == ["07:30", "08:00", "17:00", "20:00"]
+
+
+def test_greedy_fit_matches_task_by_task_greedy():
+    """Verify the fit gives the same split as checking each task in turn."""
+    durations = [20, 50, 10, 45, 5, 30, 0, 15]
+    tasks = [
+        Task(id=i, name=f"Task {i}", category="Walk", duration_minutes=d,
+             priority="medium", pet_id=1)
+        for i, d in enumerate(durations)
+    ]
+
+    for budget in range(0, 200, 5):
+        expected_scheduled, expected_skipped, remaining = [], [], budget
+        for task in tasks:
+            if task.duration_minutes <= remaining:
+                expected_scheduled.append(task)
+                remaining -= task.duration_minutes
+            else:
+                expected_skipped.append(task)
+
+        scheduled, skipped, time_used = Scheduler()._fit_tasks_to_time(tasks, budget)
+
+        assert scheduled == expected_scheduled, f"budget={budget}"
+        assert skipped == expected_skipped, f"budget={budget}"
+        assert time_used == budget - remaining, f"budget={budget}"
+
+
+def test_id_generator_counts_per_type_and_resets():
+    """Verify IDs count up independently per entity type and restart after reset."""
+    IDGenerator.reset()
+
+    assert [IDGenerator.next_id("pet") for _ in range(3)] == [1, 2, 3]
+    assert IDGenerator.next_id("task") == 1
+
+    IDGenerator.reset()
+    assert IDGenerator.next_id("pet") == 1
+
+
+def test_generate_plan_when_everything_fits():
+    """Verify all tasks are scheduled in priority order when time is plentiful."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=120)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    for task_id, priority in enumerate(["low", "high", "medium"], 1):
+        pet.add_task(Task(id=task_id, name=f"Task {task_id}", category="Walk",
+                          duration_minutes=20, priority=priority, pet_id=pet.id))
+
+    # Act
+    plan = Scheduler().generate_plan(owner)
+
+    # Assert
+    assert [task.priority for task in plan.scheduled_tasks] == ["high", "medium", "low"]
+    assert plan.skipped_tasks == []
+    assert plan.time_used == 60
+    assert plan.get_scheduled_count() == 3
+    assert plan.get_skipped_count() == 0
+    assert plan.explanation.startswith("All 3 tasks fit!")
+
+
+def test_caches_ignored_by_repr_and_equality():
+    """Verify cache/index fields don't leak into repr or change equality."""
+    # Arrange
+    warmed = Owner(id=1, name="Jordan", available_time_minutes=60,
+                   pets=[Pet(id=1, name="Mochi", species="Dog", age=3)])
+    cold = Owner(id=1, name="Jordan", available_time_minutes=60,
+                 pets=[Pet(id=1, name="Mochi", species="Dog", age=3)])
+
+    # Act
+    warmed.get_all_tasks()
+    warmed.get_total_task_time()
+
+    # Assert
+    assert warmed == cold
+    assert "_cache" not in repr(warmed)
+    assert "_owner" not in repr(warmed.pets[0])
+
+
+def test_priority_sort_keeps_order_within_level():
+    """Verify tasks with the same priority keep their original order."""
+    priorities = ["medium", "high", "low", "high", "medium", "urgent"]
+    tasks = [
+        Task(id=i, name=f"Task {i}", category="Walk", duration_minutes=10,
+             priority=priority, pet_id=1)
+        for i, priority in enumerate(priorities)
+    ]
+
+    sorted_tasks = Scheduler()._sort_tasks_by_priority(tasks)
+
+    # Unknown priorities ("urgent") are treated as low
+    assert [task.id for task in sorted_tasks] == [1, 3, 0, 4, 2, 5]
+
+
+def test_dataclasses_use_slots():
+    """Verify the data classes are slotted (no per-instance __dict__)."""
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    task = Task(id=1, name="Walk", category="Walk",
+                duration_minutes=30, priority="high", pet_id=1)
+
+    for obj in (owner, pet, task, SchedulePlan()):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+
+def test_plan_summary_format():
+    """Verify the plan summary lists time, counts and explanation on separate lines."""
+    plan = SchedulePlan(explanation="All good.", time_used=40, time_available=60)
+
+    assert plan.get_summary().split("\n") == [
+        "Daily Schedule Summary",
+        "Time Available: 60 minutes",
+        "Scheduled: 0 tasks (40 min)",
+        "Skipped: 0 tasks",
+        "",
+        "All good.",
+    ]
+
+
+def test_generate_plans_for_several_owners():
+    """Verify batch planning returns one plan per owner, in order."""
+    owners = []
+    for owner_id, budget in enumerate([15, 60], 1):
+        owner = Owner(id=owner_id, name=f"Owner {owner_id}", available_time_minutes=budget)
+        pet = Pet(id=owner_id, name=f"Pet {owner_id}", species="Dog", age=2)
+        owner.add_pet(pet)
+        pet.add_task(Task(id=owner_id, name="Walk", category="Walk",
+                          duration_minutes=30, priority="high", pet_id=pet.id))
+        owners.append(owner)
+
+    plans = Scheduler().generate_plans(owners)
+
+    assert [plan.time_available for plan in plans] == [15, 60]
+    assert [plan.get_scheduled_count() for plan in plans] == [0, 1]
+
+
+def test_owner_tasks_by_priority_match_sorted_order():
+    """Verify priority-bucketed tasks match a stable priority sort across pets."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    mochi = Pet(id=1, name="Mochi", species="Dog", age=3)
+    luna = Pet(id=2, name="Luna", species="Cat", age=5)
+    owner.add_pet(mochi)
+    owner.add_pet(luna)
+    task_specs = [(mochi, "low"), (luna, "high"), (mochi, "high"),
+                  (luna, "medium"), (mochi, "medium"), (luna, "low")]
+    for task_id, (pet, priority) in enumerate(task_specs, 1):
+        pet.add_task(Task(id=task_id, name=f"Task {task_id}", category="Walk",
+                          duration_minutes=10, priority=priority, pet_id=pet.id))
+    mochi.remove_task(5)
+
+    # Act
+    expected = Scheduler()._sort_tasks_by_priority(owner.get_all_tasks())
+
+    # Assert
+    assert owner.get_tasks_by_priority() == expected
+    assert [task.id for task in owner.get_tasks_by_priority()] == [3, 2, 4, 1, 6]
+
+
+def test_owner_pickle_round_trip():
+    """Verify an owner survives pickling and its pets still update its caches."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    pet.add_task(Task(id=1, name="Walk", category="Walk",
+                      duration_minutes=10, priority="high", pet_id=pet.id))
+    owner.get_total_task_time()
+
+    # Act
+    restored = pickle.loads(pickle.dumps(owner))
+    restored.pets[0].add_task(Task(id=2, name="Feed", category="Feeding",
+                                   duration_minutes=5, priority="low", pet_id=1))
+
+    # Assert
+    assert restored.get_total_task_time() == 15
+    assert [task.id for task in restored.get_all_tasks()] == [1, 2]
+    assert owner.get_total_task_time() == 10
+
+    restored.pets[0].get_task_by_id(1).duration_minutes = 20
+    assert restored.get_total_task_time() == 25
+
+
+def test_owner_deepcopy_relinks_pets():
+    """Verify a deep-copied owner's pets invalidate the copy, not the original."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    pet.add_task(Task(id=1, name="Walk", category="Walk",
+                      duration_minutes=10, priority="high", pet_id=pet.id))
+    owner.get_all_tasks()
+    owner.get_total_task_time()
+
+    # Act
+    clone = copy.deepcopy(owner)
+    clone.pets[0].add_task(Task(id=2, name="Feed", category="Feeding",
+                                duration_minutes=5, priority="low", pet_id=1))
+
+    # Assert
+    assert clone.get_total_task_time() == 15
+    assert clone.pets[0].get_total_task_time() == 15
+    assert owner.get_total_task_time() == 10
+    assert clone.get_pet_by_id(1) is clone.pets[0]
+
+
+def test_shallow_copy_keeps_links_with_the_original():
+    """Verify copy.copy of an owner or pet leaves shared pets/tasks linked to the original."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    task = Task(id=1, name="Walk", category="Walk",
+                duration_minutes=10, priority="high", pet_id=pet.id)
+    pet.add_task(task)
+    owner.get_total_task_time()
+
+    # Act
+    copy.copy(owner)
+    copy.copy(pet)
+    task.duration_minutes = 50
+
+    # Assert
+    assert pet.get_total_task_time() == 50
+    assert owner.get_total_task_time() == 50
+
+
+def test_duplicate_ids_are_rejected():
+    """Verify adding a pet or task whose ID is already taken raises ValueError."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    pet.add_task(Task(id=1, name="Walk", category="Walk",
+                      duration_minutes=10, priority="high", pet_id=pet.id))
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        owner.add_pet(Pet(id=1, name="Luna", species="Cat", age=5))
+    with pytest.raises(ValueError):
+        pet.add_task(Task(id=1, name="Feed", category="Feeding",
+                          duration_minutes=5, priority="low", pet_id=pet.id))
+
+    assert owner.pets == [pet]
+    assert [task.name for task in pet.tasks] == ["Walk"]
+    assert pet.get_total_task_time() == 10
+
+
+def test_pet_of_another_owner_is_rejected():
+    """Verify a pet can't be added to a second owner until the first removes it."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=60)
+    other = Owner(id=2, name="Sam", available_time_minutes=60)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        other.add_pet(pet)
+    with pytest.raises(ValueError):
+        Owner(id=3, name="Alex", available_time_minutes=60, pets=[pet])
+    assert other.pets == []
+
+    owner.remove_pet(pet.id)
+    other.add_pet(pet)
+    pet.add_task(Task(id=1, name="Walk", category="Walk",
+                      duration_minutes=10, priority="high", pet_id=pet.id))
+    assert other.get_total_task_time() == 10
+
+
+def test_editing_task_duration_updates_plan():
+    """Verify editing a task's duration after adding it is reflected in the next plan."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=30)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    task = Task(id=1, name="Walk", category="Walk",
+                duration_minutes=10, priority="high", pet_id=pet.id)
+    pet.add_task(task)
+    assert Scheduler().generate_plan(owner).scheduled_tasks == [task]
+
+    # Act
+    task.duration_minutes = 100
+    plan = Scheduler().generate_plan(owner)
+
+    # Assert
+    assert pet.get_total_task_time() == 100
+    assert owner.get_total_task_time() == 100
+    assert plan.scheduled_tasks == []
+    assert plan.skipped_tasks == [task]
+    assert plan.time_used == 0
+
+    pet.remove_task(task.id)
+    task.duration_minutes = 5
+    assert pet.get_total_task_time() == 0
+
+
+def test_editing_task_priority_reorders_plan():
+    """Verify changing a task's priority after adding it moves it in the next plan."""
+    # Arrange
+    owner = Owner(id=1, name="Jordan", available_time_minutes=120)
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+    owner.add_pet(pet)
+    for task_id, priority in enumerate(["high", "medium", "low"], 1):
+        pet.add_task(Task(id=task_id, name=f"Task {task_id}", category="Walk",
+                          duration_minutes=10, priority=priority, pet_id=pet.id))
+    assert [t.id for t in Scheduler().generate_plan(owner).scheduled_tasks] == [1, 2, 3]
+
+    # Act
+    pet.get_task_by_id(3).priority = "High"
+    plan = Scheduler().generate_plan(owner)
+
+    # Assert
+    assert pet.get_task_by_id(3).priority == "high"
+    assert pet.get_task_by_id(3).get_priority_value() == 3
+    assert [task.id for task in plan.scheduled_tasks] == [1, 3, 2]
+    assert plan.scheduled_tasks == Scheduler()._sort_tasks_by_priority(owner.get_all_tasks())
+
+
+def test_only_tracked_edits_of_a_held_task_notify_the_pet(monkeypatch):
+    """Verify construction and untracked writes skip the pet callbacks."""
+    # Arrange
+    calls = []
+    monkeypatch.setattr(Pet, "_task_duration_changed", lambda self, *args: calls.append("duration"))
+    monkeypatch.setattr(Pet, "_task_priority_changed", lambda self, *args: calls.append("priority"))
+    pet = Pet(id=1, name="Mochi", species="Dog", age=3)
+
+    # Act
+    task = Task(id=1, name="Walk", category="Walk", duration_minutes=10,
+                priority="high", pet_id=pet.id)
+    pet.add_task(task)
+    task.is_completed = True
+    task.name = "Long walk"
+    constructed_calls = list(calls)
+    task.duration_minutes = 20
+    task.priority = "low"
+
+    # Assert
+    assert constructed_calls == []
+    assert calls == ["duration", "priority"]